@@ -1,7 +1,34 @@
-from .welcome_agent import WelcomeAgent
-from .route_agent import RouteAgent
-from .chat_agent import ChatAgent
-from .sales_agent import SalesAgent
+# 各 Agent 在首次访问时才导入对应模块（PEP 562），减少应用冷启动时间。
+# 各 Agent 模块中的 langchain 依赖也在构造函数内导入，只有在首次构造 Agent 时才会加载。
+# 与 typing.TYPE_CHECKING 等价，类型检查器视其为真；不导入 typing 以免增加启动耗时
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .welcome_agent import WelcomeAgent
+    from .route_agent import RouteAgent
+    from .chat_agent import ChatAgent
+    from .sales_agent import SalesAgent
+del TYPE_CHECKING
+
+_AGENT_MODULES = {
+    'WelcomeAgent': '.welcome_agent',
+    'RouteAgent': '.route_agent',
+    'ChatAgent': '.chat_agent',
+    'SalesAgent': '.sales_agent',
+}
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        from importlib import import_module
+        value = getattr(import_module(_AGENT_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = ['WelcomeAgent', 'RouteAgent', 'ChatAgent', 'SalesAgent']
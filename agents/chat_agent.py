@@ -1,8 +1,3 @@
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate, MessagesPlaceholder
-from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langchain_openai import ChatOpenAI
-
-
 class ChatAgent:
     """
     一个用于处理用户聊天的agent，专注于旅游和地理相关话题。
@@ -16,6 +11,10 @@ class ChatAgent:
         :param base_url: OpenAI API 的基础 URL。
         :param temperature: 控制生成文本的随机性，默认为 0.6。
         """
+        from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate, MessagesPlaceholder
+        from langchain.agents import create_tool_calling_agent, AgentExecutor
+        from langchain_openai import ChatOpenAI
+
         # 初始化 OpenAI 配置
         self.api_key = api_key
         self.base_url = base_url
@@ -1,8 +1,3 @@
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
-from langchain.agents import create_tool_calling_agent, AgentExecutor
-
-
 class RouteAgent:
     """
     一个用于路由的agent，调用工具搜索本地知识库，判断调用 ChatAgent 还是 SalesAgent
@@ -17,6 +12,10 @@ class RouteAgent:
         :param base_url: OpenAI API 的基础 URL。
         :param temperature: 控制生成文本的随机性，默认为 0.6。
         """
+        from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, MessagesPlaceholder
+        from langchain_openai import ChatOpenAI
+        from langchain.agents import create_tool_calling_agent, AgentExecutor
+
         # 初始化 OpenAI 配置
         self.api_key = api_key
         self.base_url = base_url
@@ -1,8 +1,3 @@
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
-from langchain.agents import create_tool_calling_agent, AgentExecutor
-
-
 class SalesAgent:
     """
     一个用于推荐旅游产品的agent，调用知识库工具查询相关产品信息。
@@ -17,6 +12,10 @@ class SalesAgent:
         :param base_url: OpenAI API 的基础 URL。
         :param temperature: 控制生成文本的随机性，默认为 0.6。
         """
+        from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate, MessagesPlaceholder
+        from langchain_openai import ChatOpenAI
+        from langchain.agents import create_tool_calling_agent, AgentExecutor
+
         # 初始化 OpenAI 配置
         self.api_key = api_key
         self.base_url = base_url
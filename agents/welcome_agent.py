@@ -1,8 +1,3 @@
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import ChatOpenAI
-
-
 class WelcomeAgent:
     """
     一个用于生成旅游问答机器人欢迎词的agent
@@ -16,6 +11,10 @@ class WelcomeAgent:
         :param base_url: OpenAI API 的基础 URL。
         :param temperature: 控制生成文本的随机性，默认为 0.6。
         """
+        from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_openai import ChatOpenAI
+
         # 初始化 OpenAI 配置
         self.api_key = api_key
         self.base_url = base_url
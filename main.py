@@ -1,7 +1,29 @@
+import os
+from contextlib import nullcontext
+from importlib import import_module
 # 导入 Streamlit 库，用于创建交互式Web应用程序
 import streamlit as st
-from agents import WelcomeAgent, RouteAgent, ChatAgent, SalesAgent
-from my_tools import KnowledgeBase, WebSearch
+from startup_profiler import StartupProfiler, HEAVY_MODULES
+
+# 设置 STARTUP_PROFILE=1 开启启动耗时统计
+if "profiler" not in st.session_state:
+    st.session_state.profiler = StartupProfiler(enabled=os.environ.get("STARTUP_PROFILE") == "1")
+profiler = st.session_state.profiler
+
+# 导入耗时只在首次运行时统计一次，之后的重新运行模块已缓存，统计没有意义
+measure_imports = profiler.enabled and "startup_imports_measured" not in st.session_state
+
+# agents 和 my_tools 中的 langchain 依赖在首次构造组件时才会加载
+with profiler.measure("import agents, my_tools") if measure_imports else nullcontext():
+    from agents import WelcomeAgent, RouteAgent, ChatAgent, SalesAgent
+    from my_tools import KnowledgeBase, WebSearch
+
+# 提前导入 langchain 依赖并单独计时，否则其耗时会被计入第一个构造的组件
+if measure_imports:
+    with profiler.measure("import langchain deps"):
+        for module in HEAVY_MODULES:
+            import_module(module)
+    st.session_state.startup_imports_measured = True
 
 # 设置OpenAI API密钥
 OPENAI_API_KEY = "YOUR_OPENAI_API_KEY"
@@ -24,10 +46,11 @@ if "messages" not in st.session_state:
 # 创建welcome_agent，并调用其生成初始化欢迎词
 if "welcome_message" not in st.session_state:
     # 初始化 WelcomeAgent 类的实例
-    welcome_agent = WelcomeAgent(
-        api_key=OPENAI_API_KEY,
-        base_url=OPENAI_BASE_URL
-    )
+    with profiler.measure("WelcomeAgent"):
+        welcome_agent = WelcomeAgent(
+            api_key=OPENAI_API_KEY,
+            base_url=OPENAI_BASE_URL
+        )
 
     # 调用 generate_welcome_message 方法生成欢迎词,存入 session_state 中
     st.session_state.welcome_message = welcome_agent.generate_welcome_message("简短的欢迎词")
@@ -38,40 +61,55 @@ if "welcome_message" not in st.session_state:
 
 # 建立知识库并获取工具列表
 if "kb" not in st.session_state:
-    st.session_state.kb = KnowledgeBase(filepath=YOUR_FILEPATH, api_key=OPENAI_API_KEY)
+    with profiler.measure("KnowledgeBase"):
+        st.session_state.kb = KnowledgeBase(filepath=YOUR_FILEPATH, api_key=OPENAI_API_KEY)
     st.session_state.kb_tools = st.session_state.kb.get_tools()
 
 
 # 创建 route_agent
 if "route_agent" not in st.session_state:
-    st.session_state.route_agent = RouteAgent(
-            tools=st.session_state.kb_tools,
-            api_key=OPENAI_API_KEY,
-            base_url=OPENAI_BASE_URL
-    )
+    with profiler.measure("RouteAgent"):
+        st.session_state.route_agent = RouteAgent(
+                tools=st.session_state.kb_tools,
+                api_key=OPENAI_API_KEY,
+                base_url=OPENAI_BASE_URL
+        )
 
 # 创建 web_search 工具并获取工具列表
 if "ws" not in st.session_state:
-    st.session_state.ws = WebSearch(api_key=TAVILY_API_KEY)
+    with profiler.measure("WebSearch"):
+        st.session_state.ws = WebSearch(api_key=TAVILY_API_KEY)
     st.session_state.ws_tools = st.session_state.ws.get_tools()
 
 # 创建 chat_agent
 if "chat_agent" not in st.session_state:
-    st.session_state.chat_agent = ChatAgent(
-        tools=st.session_state.ws_tools,
-        api_key=OPENAI_API_KEY,
-        base_url=OPENAI_BASE_URL
-    )
+    with profiler.measure("ChatAgent"):
+        st.session_state.chat_agent = ChatAgent(
+            tools=st.session_state.ws_tools,
+            api_key=OPENAI_API_KEY,
+            base_url=OPENAI_BASE_URL
+        )
 
 
 # 创建 sales_agent
 if "sales_agent" not in st.session_state:
-    st.session_state.sales_agent = SalesAgent(
-            tools=st.session_state.tools,
-            api_key=OPENAI_API_KEY,
-            base_url=OPENAI_BASE_URL,
-            temperature=0.3
-    )
+    with profiler.measure("SalesAgent"):
+        st.session_state.sales_agent = SalesAgent(
+                tools=st.session_state.tools,
+                api_key=OPENAI_API_KEY,
+                base_url=OPENAI_BASE_URL,
+                temperature=0.3
+        )
+
+
+# 输出启动耗时报告（仅在首次启动时输出一次），之后的重新运行不再记录耗时
+if profiler.enabled and "startup_report" not in st.session_state:
+    st.session_state.startup_report = profiler.report()
+    print(st.session_state.startup_report)
+    profiler.enabled = False
+if "startup_report" in st.session_state:
+    with st.sidebar.expander("启动耗时统计"):
+        st.text(st.session_state.startup_report)
 
 
 # 展示聊天记录
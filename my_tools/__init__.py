@@ -1,4 +1,29 @@
-from .knowledge_base import KnowledgeBase
-from .web_search import WebSearch
+# 各工具在首次访问时才导入对应模块（PEP 562），减少应用冷启动时间。
+# 工具模块中的 langchain 依赖也在用到它们的方法内导入，只有在首次构造工具时才会加载。
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .knowledge_base import KnowledgeBase
+    from .web_search import WebSearch
+del TYPE_CHECKING
+
+_TOOL_MODULES = {
+    'KnowledgeBase': '.knowledge_base',
+    'WebSearch': '.web_search',
+}
+
+
+def __getattr__(name):
+    if name in _TOOL_MODULES:
+        from importlib import import_module
+        value = getattr(import_module(_TOOL_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = ['KnowledgeBase', 'WebSearch']
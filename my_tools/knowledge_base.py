@@ -1,9 +1,3 @@
-from langchain_core.tools import Tool
-from langchain_community.document_loaders import TextLoader
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
-from langchain_text_splitters import CharacterTextSplitter
-
 class KnowledgeBase:
     """
     一个用于构建和管理产品知识库的类。
@@ -30,6 +24,11 @@ class KnowledgeBase:
 
         :return: 一个向量存储实例（Chroma）。
         """
+        from langchain_community.document_loaders import TextLoader
+        from langchain_community.vectorstores import FAISS
+        from langchain_openai import OpenAIEmbeddings
+        from langchain_text_splitters import CharacterTextSplitter
+
         # 读取文件内容
         loader = TextLoader("state_of_the_union.txt")
         documents = loader.load()
@@ -63,6 +62,7 @@ class KnowledgeBase:
 
         :return: 工具列表。
         """
+        from langchain_core.tools import Tool
 
         tools = [
             Tool(
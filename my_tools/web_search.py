@@ -1,7 +1,3 @@
-from langchain_core.tools import Tool
-from langchain_community.tools.tavily_search import TavilySearchResults
-
-
 class WebSearch:
     """
     一个用于封装 Tavily 搜索引擎的工具类。
@@ -13,6 +9,8 @@ class WebSearch:
 
         :param max_results: 搜索结果的最大数量，默认为 2。
         """
+        from langchain_community.tools.tavily_search import TavilySearchResults
+
         self.max_results = max_results
         self.api_key = api_key
         self.search = TavilySearchResults(tavily_api_key=self.api_key, max_results=self.max_results)
@@ -36,6 +34,8 @@ class WebSearch:
 
         :return: 工具列表。
         """
+        from langchain_core.tools import Tool
+
         tools = [
             Tool(
                 name="WebSearch",
@@ -0,0 +1,152 @@
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+
+# 项目根目录，子进程在此目录下运行以便导入 agents、my_tools
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# agents、my_tools 包冷启动导入耗时的回归阈值（秒），重新在模块顶层导入 langchain 会远超此值
+IMPORT_TIME_THRESHOLD = 0.05
+
+# 应用启动时需要导入的包，以及它们背后的重型依赖
+APP_MODULES = ['agents', 'my_tools']
+HEAVY_MODULES = [
+    'langchain.agents',
+    'langchain_openai',
+    'langchain_community.vectorstores',
+    'langchain_community.tools.tavily_search',
+]
+
+
+class StartupProfiler:
+    """
+    一个用于统计应用启动阶段各组件耗时的分析器。
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        初始化 StartupProfiler。
+
+        :param enabled: 是否开启计时，关闭时 measure 不做任何记录。
+        """
+        self.enabled = enabled
+        # 组件名称 -> 耗时（秒），同一组件重新统计时覆盖旧记录
+        self.records = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        统计一段代码的耗时。
+
+        :param name: 被统计的组件名称，如 "KnowledgeBase"。
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records[name] = time.perf_counter() - start
+
+    def report(self) -> str:
+        """
+        生成耗时报告。
+
+        :return: 每个组件一行的耗时报告字符串。
+        """
+        lines = [f"{name:<40} {seconds * 1000:>10.1f} ms" for name, seconds in self.records.items()]
+        total = sum(self.records.values())
+        lines.append(f"{'total':<40} {total * 1000:>10.1f} ms")
+        return "\n".join(lines)
+
+
+def measure_cold_import(module: str) -> float:
+    """
+    在全新的 Python 进程中统计导入模块的耗时，避免受当前进程已缓存模块的影响。
+
+    :param module: 模块名称。
+    :return: 导入耗时（秒）。
+    :raises ImportError: 子进程中导入模块失败时抛出，错误信息为子进程的最后一行报错。
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.strip().splitlines()
+        raise ImportError(stderr[-1] if stderr else f"import {module} failed")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    """
+    命令行入口：统计各包的冷启动导入耗时，超过阈值时返回非零退出码。
+    """
+    parser = argparse.ArgumentParser(description="统计应用冷启动时的导入耗时")
+    parser.add_argument(
+        "--max-import-seconds",
+        type=float,
+        default=IMPORT_TIME_THRESHOLD,
+        help=f"agents、my_tools 包导入耗时的回归阈值（秒），默认为 {IMPORT_TIME_THRESHOLD}",
+    )
+    parser.add_argument(
+        "--heavy",
+        action="store_true",
+        help="同时统计 langchain 等重型依赖的导入耗时，仅用于参考",
+    )
+    args = parser.parse_args(argv)
+
+    profiler = StartupProfiler()
+    regressions = []
+    failures = []
+
+    for module in APP_MODULES:
+        try:
+            seconds = measure_cold_import(module)
+        except ImportError as e:
+            failures.append(module)
+            print(f"导入 {module} 失败: {e}")
+            continue
+        profiler.records[f"import {module}"] = seconds
+        if seconds > args.max_import_seconds:
+            regressions.append(module)
+
+    if args.heavy:
+        for module in HEAVY_MODULES:
+            if importlib.util.find_spec(module.split('.')[0]) is None:
+                print(f"跳过未安装的依赖: {module}")
+                continue
+            try:
+                seconds = measure_cold_import(module)
+            except ImportError as e:
+                print(f"导入 {module} 失败: {e}")
+                continue
+            profiler.records[f"import {module}"] = seconds
+
+    print(profiler.report())
+
+    if failures:
+        return 1
+    if regressions:
+        print(f"导入耗时超过阈值 {args.max_import_seconds}s: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
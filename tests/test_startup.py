@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+
+from startup_profiler import ROOT_DIR
+
+# 导入耗时上限（秒）。取多次运行的最小值以排除机器负载的干扰；
+# 在模块顶层导入 langchain 需要数秒，远超此值
+IMPORT_TIME_LIMIT = 0.5
+IMPORT_RUNS = 3
+
+
+def _import_app_packages():
+    """
+    在全新的 Python 进程中导入 agents、my_tools，返回导入耗时和已加载的 langchain 模块。
+    """
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import agents, my_tools\n"
+        "seconds = time.perf_counter() - start\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('langchain'))\n"
+        "print(json.dumps({'seconds': seconds, 'loaded': loaded}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_langchain():
+    assert _import_app_packages()['loaded'] == []
+
+
+def test_import_time_under_limit():
+    seconds = min(_import_app_packages()['seconds'] for _ in range(IMPORT_RUNS))
+    assert seconds < IMPORT_TIME_LIMIT